@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Hot Store Memory Benchmark
+Memory per million readings: hot-store ring buffers vs loaded SensorData ORM objects
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+def load_app(database_url: str):
+    os.environ["DATABASE_URL"] = database_url
+    sys.path.insert(0, str(Path(__file__).parent))
+    import sample_app_structure as api
+
+    api.Base.metadata.create_all(bind=api.engine)
+    return api
+
+def traced_bytes(build):
+    """Bytes still allocated after build() returns (its result is kept alive)"""
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return current
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare hot-store and ORM memory per reading")
+    parser.add_argument("--readings", type=int, default=200_000)
+    args = parser.parse_args()
+    n = args.readings
+
+    with tempfile.TemporaryDirectory() as tmp:
+        api = load_app(f"sqlite:///{tmp}/memory.db")
+        start = datetime(2026, 1, 1)
+        rows = [{"timestamp": start + timedelta(milliseconds=i), "sensor_type": "temp",
+                 "value": random.random(), "unit": "C", "location": f"ward-{i % 8}"} for i in range(n)]
+        with api.engine.begin() as conn:
+            conn.execute(api.SensorData.__table__.insert(), rows)
+        del rows
+
+        def load_orm():
+            db = api.SessionLocal()
+            return db, db.query(api.SensorData).all()
+
+        def load_hot_store():
+            store = api.HotSensorStore(capacity=n, max_sensors=1)
+            ids = np.arange(1, n + 1, dtype=np.int64)
+            ts_us = api.to_epoch_us(start) + ids * 1000
+            values = np.random.random(n).astype(np.float32)
+            for location in range(8):
+                sl = slice(location, None, 8)
+                store.extend("temp", "C", f"ward-{location}", ids[sl], ts_us[sl], values[sl])
+            return store
+
+        orm = traced_bytes(load_orm)
+        hot = traced_bytes(load_hot_store)
+        api.engine.dispose()
+
+    print(f"{'representation':<20} {'bytes/reading':>14} {'MB per million':>15}")
+    for name, total in (("SensorData ORM", orm), ("hot store", hot)):
+        print(f"{name:<20} {total / n:>14.1f} {total / n:>15.1f}")
+
+if __name__ == "__main__":
+    main()
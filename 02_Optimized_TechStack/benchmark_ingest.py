@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Ingest Benchmark
+Bytes on the wire and rows/sec: JSON /sensor-data/ vs binary /sensor-data/binary
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+def load_app(database_url: str):
+    os.environ["DATABASE_URL"] = database_url
+    os.environ.setdefault("HOT_STORE_ENABLED", "1")
+    sys.path.insert(0, str(Path(__file__).parent))
+    import sample_app_structure as api
+
+    api.Base.metadata.create_all(bind=api.engine)
+    return api
+
+def ecg_like(samples: int, rate: float) -> np.ndarray:
+    """Noisy periodic signal, roughly what a kHz biosignal gateway sends"""
+    t = np.arange(samples) / rate
+    rng = np.random.default_rng(0)
+    return (np.sin(2 * np.pi * 1.2 * t) + 0.05 * rng.standard_normal(samples)).astype(np.float32)
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare JSON and binary sensor ingest")
+    parser.add_argument("--json-samples", type=int, default=2000, help="samples posted one by one as JSON")
+    parser.add_argument("--binary-samples", type=int, default=100_000, help="samples per binary request")
+    parser.add_argument("--rate", type=float, default=1000.0, help="sample rate in Hz")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        api = load_app(f"sqlite:///{tmp}/ingest.db")
+        from fastapi.testclient import TestClient
+        client = TestClient(api.app)
+
+        results = []
+
+        signal = ecg_like(args.json_samples, args.rate)
+        bodies = [json.dumps({"sensor_type": "ecg", "value": float(v), "unit": "mV", "location": "ward-3"})
+                  for v in signal]
+        start = time.perf_counter()
+        for body in bodies:
+            client.post("/sensor-data/", content=body, headers={"Content-Type": "application/json"})
+        elapsed = time.perf_counter() - start
+        results.append(("json (1 row/request)", sum(map(len, bodies)) / len(bodies), len(bodies) / elapsed))
+
+        signal = ecg_like(args.binary_samples, args.rate)
+        counts = np.round(signal / 0.001).astype(np.int16)  # 1 uV resolution ADC counts
+        variants = [
+            ("binary float32", signal, "none", 1.0),
+            ("binary float32 + gzip", signal, "gzip", 1.0),
+            ("binary float32 + zstd", signal, "zstd", 1.0),
+            ("binary int16", counts, "none", 0.001),
+            ("binary int16 + zstd", counts, "zstd", 0.001),
+        ]
+        for name, samples, compression, scale in variants:
+            body = api.encode_sensor_batch("ecg", "mV", "ward-3", datetime.utcnow(), args.rate,
+                                           samples, compression=compression, scale=scale)
+            start = time.perf_counter()
+            response = client.post("/sensor-data/binary", content=body,
+                                   headers={"Content-Type": "application/octet-stream"})
+            elapsed = time.perf_counter() - start
+            response.raise_for_status()
+            results.append((name, len(body) / len(samples), len(samples) / elapsed))
+
+        print(f"{'format':<24} {'bytes/sample':>13} {'rows/sec':>12}")
+        for name, bytes_per_sample, rows_per_sec in results:
+            print(f"{name:<24} {bytes_per_sample:>13.2f} {rows_per_sec:>12,.0f}")
+        api.engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Worker Scaling Benchmark
+Measures API throughput of sample_app_structure.py with 1..N worker processes
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import httpx
+
+APP = Path(__file__).with_name("sample_app_structure.py")
+
+def seed_database(database_url: str, samples: int):
+    """Create the schema and load one sensor_type worth of readings"""
+    os.environ["DATABASE_URL"] = database_url
+    sys.path.insert(0, str(APP.parent))
+    import sample_app_structure as api
+
+    api.Base.metadata.create_all(bind=api.engine)
+    with api.engine.begin() as conn:
+        conn.execute(api.SensorData.__table__.insert(), [
+            {"sensor_type": "bench", "value": random.gauss(37.0, 0.5), "unit": "C", "location": "lab"}
+            for _ in range(samples)
+        ])
+    api.engine.dispose()
+
+def wait_until_healthy(base_url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if httpx.get(f"{base_url}/health").status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("Server did not become healthy")
+
+def client_loop(url: str, duration: float) -> int:
+    """Issue requests back to back for `duration` seconds; return successes"""
+    done = 0
+    deadline = time.monotonic() + duration
+    with httpx.Client(timeout=30.0) as client:
+        while time.monotonic() < deadline:
+            if client.get(url).status_code == 200:
+                done += 1
+    return done
+
+def measure(workers: int, args, env: dict) -> float:
+    """Start the app with `workers` processes and return requests/second"""
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, str(APP), "--host", "127.0.0.1", "--port", str(args.port), "--workers", str(workers)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_healthy(base_url)
+        urls = [base_url + args.path] * args.clients
+        with ProcessPoolExecutor(max_workers=args.clients) as pool:
+            list(pool.map(client_loop, urls, [2.0] * args.clients))  # warm up every worker
+            counts = pool.map(client_loop, urls, [args.duration] * args.clients)
+            return sum(counts) / args.duration
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Benchmark API throughput from 1 to N workers")
+    parser.add_argument("--max-workers", type=int, default=cores)
+    parser.add_argument("--clients", type=int, default=max(4, 2 * cores), help="concurrent client processes")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per measurement")
+    parser.add_argument("--samples", type=int, default=5000, help="readings seeded for the analysis endpoint")
+    parser.add_argument("--path", default="/sensor-data/analysis/bench")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if args.max_workers > 1 and not os.getenv("REDIS_URL"):
+        raise SystemExit("Set REDIS_URL (e.g. redis://localhost:6379/0): multi-worker mode shares state through Redis")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{tmp}/bench.db"
+        seed_database(database_url, args.samples)
+        env = dict(os.environ, DATABASE_URL=database_url)
+
+        counts = sorted({1, args.max_workers} | {2 ** i for i in range(1, args.max_workers.bit_length()) if 2 ** i < args.max_workers})
+        baseline = None
+        print(f"{'workers':>8} {'req/s':>10} {'speedup':>8}")
+        for workers in counts:
+            rps = measure(workers, args, env)
+            baseline = baseline or rps
+            print(f"{workers:>8} {rps:>10.1f} {rps / baseline:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
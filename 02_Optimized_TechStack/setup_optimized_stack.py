@@ -7,14 +7,36 @@ MATLAB + Python + SQL + Web Framework
 import subprocess
 import sys
 import os
+import argparse
+import hashlib
+import inspect
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 
-def install_python_packages():
+REQUIREMENTS_FILE = "requirements_optimized.txt"
+WHEEL_CACHE_DIR = Path.home() / ".cache" / "engineering-stack-wheels"
+STATE_FILE = ".setup_state.json"
+
+def install_python_packages(wheel_cache=WHEEL_CACHE_DIR):
     """Install Python packages for the optimized stack"""
     print("🐍 Installing Python packages for optimized tech stack...")
     
     try:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements_optimized.txt"])
+        if wheel_cache:
+            # Install offline from the cache; only go to the index to fill it when wheels are missing
+            Path(wheel_cache).mkdir(parents=True, exist_ok=True)
+            offline = [sys.executable, "-m", "pip", "install", "--no-index",
+                       "--find-links", str(wheel_cache), "-r", REQUIREMENTS_FILE]
+            if subprocess.call(offline) != 0:
+                print("📦 Wheel cache incomplete, downloading missing wheels...")
+                subprocess.check_call([sys.executable, "-m", "pip", "wheel", "-q",
+                                       "--wheel-dir", str(wheel_cache), "--find-links", str(wheel_cache),
+                                       "-r", REQUIREMENTS_FILE])
+                subprocess.check_call(offline)
+        else:
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", REQUIREMENTS_FILE])
         print("✅ Python packages installed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -43,8 +65,11 @@ def setup_database():
             "CREATE DATABASE engineering_db;"
         ], check=True, capture_output=True)
         print("✅ Database 'engineering_db' created")
-    except subprocess.CalledProcessError:
-        print("⚠️ Database might already exist or connection failed")
+    except subprocess.CalledProcessError as e:
+        if b"already exists" not in e.stderr:
+            print(f"❌ Could not create database: {e.stderr.decode(errors='replace').strip()}")
+            return False
+        print("✅ Database 'engineering_db' already exists")
     
     return True
 
@@ -71,7 +96,6 @@ def create_project_structure():
     # Create essential files
     files_to_create = {
         "backend/main.py": "# FastAPI backend application",
-        "frontend/package.json": '{"name": "engineering-frontend", "version": "1.0.0"}',
         "database/schema.sql": "-- Database schema for engineering applications",
         "matlab_scripts/signal_processing.m": "% MATLAB signal processing scripts",
         "data_processing/etl.py": "# Data processing and ETL scripts",
@@ -242,34 +266,151 @@ def create_react_frontend():
     
     print("✅ Created React frontend configuration")
 
-def main():
+class Step:
+    """A setup step with its dependencies and the inputs that decide whether it must rerun"""
+    
+    def __init__(self, name, func, deps=(), inputs=(), outputs=(), kwargs=None):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.inputs = tuple(inputs)  # files whose contents feed the fingerprint
+        self.outputs = tuple(outputs)  # paths that must still exist for the step to be skipped
+        self.kwargs = kwargs or {}
+    
+    def run(self):
+        return self.func(**self.kwargs)
+    
+    def fingerprint(self, dep_tokens):
+        digest = hashlib.sha256(inspect.getsource(self.func).encode())
+        digest.update(json.dumps([sys.executable, self.kwargs], sort_keys=True, default=str).encode())
+        for path in self.inputs:
+            digest.update(Path(path).read_bytes() if Path(path).exists() else b"<missing>")
+        for dep in self.deps:
+            digest.update(dep_tokens[dep].encode())
+        return digest.hexdigest()
+
+def load_state():
+    try:
+        with open(STATE_FILE) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_state(state):
+    with open(STATE_FILE, 'w') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+
+def run_steps(steps, jobs=4, force=False):
+    """Run steps concurrently as their dependencies finish.
+    
+    A step is skipped when its fingerprint (function source, input files and
+    dependency run tokens) matches the last successful run. Every real run
+    issues a new token, so steps downstream of a rerun step rerun too (e.g. a
+    step that overwrites files its dependency just regenerated). Returns a
+    dict of step name -> (status, seconds).
+    """
+    by_name = {step.name: step for step in steps}
+    state = {} if force else load_state()
+    fingerprints = {}
+    tokens = {}
+    results = {}
+    pending = dict(by_name)
+    running = {}
+    
+    def timed(step):
+        start = time.perf_counter()
+        try:
+            ok = step.run() is not False
+        except Exception as e:
+            print(f"❌ {step.name} failed: {e}")
+            ok = False
+        return ok, time.perf_counter() - start
+    
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while pending or running:
+            for name, step in list(pending.items()):
+                if any(dep not in results for dep in step.deps):
+                    continue
+                del pending[name]
+                if any(results[dep][0] in ("failed", "blocked") for dep in step.deps):
+                    results[name] = ("blocked", 0.0)
+                    continue
+                fingerprints[name] = step.fingerprint(tokens)
+                previous = state.get(name)
+                if (isinstance(previous, dict) and previous.get("fingerprint") == fingerprints[name]
+                        and all(Path(p).exists() for p in step.outputs)):
+                    tokens[name] = previous["token"]
+                    results[name] = ("skipped", 0.0)
+                    continue
+                running[executor.submit(timed, step)] = step
+            
+            if not running:
+                if pending:
+                    raise ValueError(f"Unresolvable step dependencies: {sorted(pending)}")
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                ok, seconds = future.result()
+                results[step.name] = ("done" if ok else "failed", seconds)
+                if ok:
+                    tokens[step.name] = os.urandom(16).hex()
+                    state[step.name] = {"fingerprint": fingerprints[step.name], "token": tokens[step.name]}
+                else:
+                    state.pop(step.name, None)
+                save_state(state)
+    
+    return results
+
+def build_steps(wheel_cache=WHEEL_CACHE_DIR, skip=()):
+    """Setup steps and their dependency graph"""
+    steps = [
+        Step("python_packages", install_python_packages, inputs=[REQUIREMENTS_FILE],
+             kwargs={"wheel_cache": wheel_cache}),
+        Step("database", setup_database),
+        Step("project_structure", create_project_structure, outputs=["backend/main.py", "tests/test_api.py"]),
+        Step("matlab_integration", create_matlab_integration, deps=["project_structure"],
+             outputs=["matlab_scripts/process_engineering_data.m"]),
+        Step("docker", create_docker_setup, outputs=["Dockerfile", "docker-compose.yml"]),
+        Step("react_frontend", create_react_frontend, deps=["project_structure"],
+             outputs=["frontend/package.json"]),
+    ]
+    skipped = set(skip)
+    return [
+        Step(s.name, s.func, [d for d in s.deps if d not in skipped], s.inputs, s.outputs, s.kwargs)
+        for s in steps if s.name not in skipped
+    ]
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Set up the optimized tech stack")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 4,
+                        help="maximum number of steps to run at once")
+    parser.add_argument("--force", action="store_true",
+                        help="rerun every step even if its inputs are unchanged")
+    parser.add_argument("--skip", action="append", default=[], metavar="STEP",
+                        help="step to leave out (repeatable)")
+    parser.add_argument("--wheel-cache", default=str(WHEEL_CACHE_DIR),
+                        help="local wheel cache for pip ('' to install straight from the index)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main setup function"""
+    args = parse_args(argv)
+    
     print("🚀 Setting up Optimized Tech Stack")
     print("=" * 50)
     print("MATLAB + Python + SQL + Web Framework")
     print("=" * 50)
     
-    success = True
-    
-    # Install Python packages
-    if not install_python_packages():
-        success = False
-    
-    # Setup database
-    if not setup_database():
-        success = False
-    
-    # Create project structure
-    create_project_structure()
-    
-    # Create MATLAB integration
-    create_matlab_integration()
+    start = time.perf_counter()
+    results = run_steps(build_steps(args.wheel_cache or None, args.skip), jobs=args.jobs, force=args.force)
     
-    # Create Docker setup
-    create_docker_setup()
+    print("\n⏱️ Step timings")
+    for name, (status, seconds) in results.items():
+        print(f"   {name:<20} {status:<8} {seconds:6.2f}s")
+    print(f"   {'total':<20} {'':<8} {time.perf_counter() - start:6.2f}s")
     
-    # Create React frontend
-    create_react_frontend()
+    success = all(status in ("done", "skipped") for status, _ in results.values())
     
     if success:
         print("\n🎉 Optimized Tech Stack Setup Complete!")